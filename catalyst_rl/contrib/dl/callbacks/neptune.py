@@ -1,4 +1,8 @@
-from typing import Dict, List  # isort:skip
+from typing import Dict, List, Tuple  # isort:skip
+import logging
+import queue
+import threading
+import weakref
 
 import neptune
 
@@ -6,6 +10,64 @@ from catalyst_rl.core import (
     _State, Callback, CallbackNode, CallbackOrder, CallbackType
 )
 
+logger = logging.getLogger(__name__)
+
+
+def _neptune_log_loop(experiment, metrics_queue: queue.Queue):
+    num_failed = 0
+    is_stopped = False
+    while not is_stopped:
+        # block for the first item, then take everything already queued
+        # and send it as one batch
+        items = [metrics_queue.get()]
+        while items[-1] is not None:
+            try:
+                items.append(metrics_queue.get_nowait())
+            except queue.Empty:
+                break
+        if items[-1] is None:
+            is_stopped = True
+            items.pop()
+
+        # only the latest value per (metric, step) is sent
+        batch = {(name, step): value for name, step, value in items}
+        for (metric_name, step), metric_value in batch.items():
+            try:
+                experiment.log_metric(metric_name, y=metric_value, x=step)
+            except Exception as ex:
+                # warn once, the total is reported when logging stops
+                if num_failed == 0:
+                    logger.warning(f"neptune.send.error: {ex}")
+                num_failed += 1
+
+        for _ in range(len(items) + is_stopped):
+            metrics_queue.task_done()
+
+    if num_failed > 1:
+        logger.warning(
+            f"neptune.send.error: {num_failed} metrics "
+            f"were not sent to Neptune"
+        )
+
+
+def _stop_neptune_logging(
+    experiment,
+    metrics_queue: queue.Queue,
+    worker: threading.Thread,
+    timeout: float,
+):
+    try:
+        metrics_queue.put(None, timeout=timeout)
+    except queue.Full:
+        pass
+    worker.join(timeout=timeout)
+    if worker.is_alive():
+        logger.warning(
+            f"neptune.send.error: worker did not finish in {timeout}s, "
+            f"~{metrics_queue.qsize()} metrics were not sent"
+        )
+    experiment.stop()
+
 
 class NeptuneLogger(Callback):
     """
@@ -65,6 +127,9 @@ class NeptuneLogger(Callback):
         log_on_batch_end: bool = True,
         log_on_epoch_end: bool = True,
         offline_mode: bool = False,
+        queue_size: int = 10000,
+        backpressure: bool = True,
+        flush_timeout: float = 30.0,
         **logging_params,
     ):
         """
@@ -75,6 +140,13 @@ class NeptuneLogger(Callback):
             log_on_epoch_end (bool): logs per-epoch metrics if set True
             offline_mode (bool): whether logging to Neptune server should
                  be turned off. It is useful for debugging.
+            queue_size (int): max number of metrics waiting
+                to be sent to Neptune by the background thread
+            backpressure (bool): if set True, blocks training
+                when the queue is full, otherwise drops new metrics
+            flush_timeout (float): max time in seconds to wait
+                for queued metrics to be sent at loader and stage end,
+                and when the logger is closed
         """
         super().__init__(
             order=CallbackOrder.Logging,
@@ -82,6 +154,10 @@ class NeptuneLogger(Callback):
             type=CallbackType.Experiment,
         )
         self.metrics_to_log = metric_names
+        self._metric_filter = \
+            frozenset(metric_names) if metric_names is not None else None
+        # full Neptune metric names per (mode, suffix)
+        self._names_cache: Dict[Tuple[str, str], Dict[str, str]] = {}
         self.log_on_batch_end = log_on_batch_end
         self.log_on_epoch_end = log_on_epoch_end
 
@@ -96,42 +172,144 @@ class NeptuneLogger(Callback):
             self.batch_log_suffix = "_batch"
             self.epoch_log_suffix = "_epoch"
 
-        if offline_mode:
-            neptune.init(
-                project_qualified_name="dry-run/project",
-                backend=neptune.OfflineBackend()
-            )
-        else:
-            neptune.init(
-                api_token=logging_params["api_token"],
-                project_qualified_name=logging_params["project_name"],
-            )
+        if not offline_mode:
+            missing_params = [
+                key for key in ("api_token", "project_name")
+                if key not in logging_params
+            ]
+            if missing_params:
+                raise ValueError(
+                    f"NeptuneLogger requires {missing_params} "
+                    f"unless offline_mode is set"
+                )
 
-        logging_params.pop("api_token")
-        logging_params.pop("project_name")
+        # Neptune experiment is created on first use,
+        # so constructing the callback does no network I/O
+        self._offline_mode = offline_mode
+        self._logging_params = logging_params
+        self._initialized = False
+        self.experiment = None
 
-        self.experiment = neptune.create_experiment(**logging_params)
+        # metrics are sent to Neptune by a background thread,
+        # so network latency stays off the training loop
+        self.backpressure = backpressure
+        self.flush_timeout = flush_timeout
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._worker = None
+        self._finalizer = None
+        self._closed = False
 
     def __del__(self):
-        self.experiment.stop()
+        # best-effort fallback, use ``close`` to stop logging explicitly
+        self.close()
+
+    def close(self):
+        """
+        Sends all queued metrics to Neptune, stops the background worker
+        and the Neptune experiment. Safe to call multiple times.
+        """
+        self._closed = True
+        finalizer = getattr(self, "_finalizer", None)
+        if finalizer is not None:
+            finalizer()
+
+    def _ensure_init(self) -> bool:
+        if self._closed:
+            return False
+        if self._initialized:
+            return True
+
+        logging_params = dict(self._logging_params)
+        api_token = logging_params.pop("api_token", None)
+        project_name = logging_params.pop("project_name", None)
+        try:
+            if self._offline_mode:
+                neptune.init(
+                    project_qualified_name="dry-run/project",
+                    backend=neptune.OfflineBackend()
+                )
+            else:
+                neptune.init(
+                    api_token=api_token,
+                    project_qualified_name=project_name,
+                )
+            self.experiment = neptune.create_experiment(**logging_params)
+        except Exception as ex:
+            # training goes on, but logging stays disabled for this run
+            self._closed = True
+            logger.warning(
+                f"neptune.init.error: {ex}, NeptuneLogger is disabled"
+            )
+            return False
+
+        self._worker = threading.Thread(
+            target=_neptune_log_loop,
+            kwargs={
+                "experiment": self.experiment,
+                "metrics_queue": self._queue,
+            },
+            daemon=True,
+        )
+        self._worker.start()
+        # stops the worker on garbage collection or interpreter exit,
+        # while daemon threads are still alive
+        self._finalizer = weakref.finalize(
+            self,
+            _stop_neptune_logging,
+            experiment=self.experiment,
+            metrics_queue=self._queue,
+            worker=self._worker,
+            timeout=self.flush_timeout,
+        )
+        self._initialized = True
+        return True
+
+    def _wait_sent(self):
+        if not self._initialized or self._closed:
+            return
+        # bounded ``queue.join``, a stalled Neptune must not hang training
+        with self._queue.all_tasks_done:
+            is_sent = self._queue.all_tasks_done.wait_for(
+                lambda: self._queue.unfinished_tasks == 0,
+                timeout=self.flush_timeout,
+            )
+        if not is_sent:
+            logger.warning(
+                f"neptune.send.error: metrics were not sent "
+                f"in {self.flush_timeout}s, continuing in background"
+            )
+
+    def _enqueue(self, metric_name: str, step: int, metric_value: float):
+        item = (metric_name, step, metric_value)
+        if self.backpressure:
+            self._queue.put(item)
+        else:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                pass
 
     def _log_metrics(
         self, metrics: Dict[str, float], step: int, mode: str, suffix=""
     ):
-        if self.metrics_to_log is None:
-            metrics_to_log = sorted(list(metrics.keys()))
+        if self._metric_filter is None:
+            items = metrics.items()
         else:
-            metrics_to_log = self.metrics_to_log
+            items = (
+                (name, value) for name, value in metrics.items()
+                if name in self._metric_filter
+            )
 
-        for name in metrics_to_log:
-            if name in metrics:
-                metric_name = f"{name}/{mode}{suffix}"
-                metric_value = metrics[name]
-                self.experiment.log_metric(metric_name, y=metric_value, x=step)
+        names = self._names_cache.setdefault((mode, suffix), {})
+        for name, metric_value in items:
+            metric_name = names.get(name)
+            if metric_name is None:
+                metric_name = names[name] = f"{name}/{mode}{suffix}"
+            self._enqueue(metric_name, step, metric_value)
 
     def on_batch_end(self, state: _State):
         """Log batch metrics to Neptune"""
-        if self.log_on_batch_end:
+        if self.log_on_batch_end and self._ensure_init():
             mode = state.loader_name
             metrics_ = state.batch_metrics
             self._log_metrics(
@@ -143,7 +321,7 @@ class NeptuneLogger(Callback):
 
     def on_loader_end(self, state: _State):
         """Translate epoch metrics to Neptune"""
-        if self.log_on_epoch_end:
+        if self.log_on_epoch_end and self._ensure_init():
             mode = state.loader_name
             metrics_ = state.loader_metrics
             self._log_metrics(
@@ -152,3 +330,13 @@ class NeptuneLogger(Callback):
                 mode=mode,
                 suffix=self.epoch_log_suffix,
             )
+        # wait for the loader metrics to be sent
+        self._wait_sent()
+
+    def on_stage_end(self, state: _State):
+        """Wait for all queued metrics to be sent to Neptune"""
+        self._wait_sent()
+
+    def on_exception(self, state: _State):
+        """Send queued metrics and stop Neptune experiment"""
+        self.close()
@@ -0,0 +1,217 @@
+from types import SimpleNamespace
+import queue
+import threading
+import time
+
+import pytest
+
+neptune = pytest.importorskip("neptune")
+
+from catalyst_rl.contrib.dl.callbacks.neptune import (  # noqa
+    _neptune_log_loop, NeptuneLogger
+)
+
+
+class _FakeExperiment:
+    def __init__(self, release: threading.Event = None):
+        self.logged = []
+        self.stopped = False
+        self.entered = threading.Event()
+        self.release = release
+
+    def log_metric(self, name, y, x):
+        self.entered.set()
+        if self.release is not None:
+            self.release.wait()
+        self.logged.append((name, x, y))
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_neptune(monkeypatch):
+    calls = []
+    experiment = _FakeExperiment()
+
+    def _init(**kwargs):
+        calls.append("init")
+
+    def _create_experiment(**kwargs):
+        calls.append("create_experiment")
+        return experiment
+
+    monkeypatch.setattr(neptune, "init", _init)
+    monkeypatch.setattr(neptune, "create_experiment", _create_experiment)
+    return SimpleNamespace(calls=calls, experiment=experiment)
+
+
+def _batch_state(step, metrics):
+    return SimpleNamespace(
+        loader_name="train", global_step=step, batch_metrics=metrics
+    )
+
+
+def test_all_metrics_are_sent(fake_neptune):
+    logger = NeptuneLogger(
+        log_on_epoch_end=False, api_token="token", project_name="project"
+    )
+    for step in range(100):
+        logger.on_batch_end(_batch_state(step, {"loss": step, "acc": 1}))
+    logger.close()
+
+    assert len(fake_neptune.experiment.logged) == 200
+    assert ("loss/train", 42, 42) in fake_neptune.experiment.logged
+    assert fake_neptune.experiment.stopped
+
+
+def test_no_backpressure_drops_metrics(fake_neptune):
+    release = threading.Event()
+    fake_neptune.experiment.release = release
+    logger = NeptuneLogger(
+        log_on_epoch_end=False,
+        queue_size=2,
+        backpressure=False,
+        api_token="token",
+        project_name="project",
+    )
+    logger.on_batch_end(_batch_state(0, {"loss": 0}))
+    # worker is stuck sending the first metric, the queue holds two more
+    fake_neptune.experiment.entered.wait()
+    for step in range(1, 10):
+        logger.on_batch_end(_batch_state(step, {"loss": step}))
+    release.set()
+    logger.close()
+
+    assert len(fake_neptune.experiment.logged) == 3
+
+
+def test_stage_end_waits_for_sent(fake_neptune):
+    logger = NeptuneLogger(
+        log_on_epoch_end=False, api_token="token", project_name="project"
+    )
+    for step in range(100):
+        logger.on_batch_end(_batch_state(step, {"loss": step}))
+    logger.on_stage_end(SimpleNamespace())
+
+    assert logger._queue.unfinished_tasks == 0
+    assert len(fake_neptune.experiment.logged) == 100
+    logger.close()
+
+
+def test_wait_is_bounded(fake_neptune):
+    release = threading.Event()
+    fake_neptune.experiment.release = release
+    logger = NeptuneLogger(
+        log_on_epoch_end=False,
+        flush_timeout=0.1,
+        api_token="token",
+        project_name="project",
+    )
+    logger.on_batch_end(_batch_state(0, {"loss": 0}))
+
+    start = time.monotonic()
+    logger.on_stage_end(SimpleNamespace())
+    assert time.monotonic() - start < 1.0
+
+    release.set()
+    logger.close()
+    assert len(fake_neptune.experiment.logged) == 1
+
+
+def test_close_before_init(fake_neptune):
+    logger = NeptuneLogger(api_token="token", project_name="project")
+    logger.close()
+    logger.on_batch_end(_batch_state(0, {"loss": 0}))
+
+    assert fake_neptune.calls == []
+
+
+def test_exception_stops_logging(fake_neptune):
+    logger = NeptuneLogger(
+        log_on_epoch_end=False, api_token="token", project_name="project"
+    )
+    logger.on_batch_end(_batch_state(0, {"loss": 0}))
+    logger.on_exception(SimpleNamespace())
+    logger.on_batch_end(_batch_state(1, {"loss": 1}))
+
+    assert fake_neptune.experiment.stopped
+    assert fake_neptune.experiment.logged == [("loss/train", 0, 0)]
+
+
+def test_log_loop_sends_batches():
+    experiment = _FakeExperiment()
+    metrics_queue = queue.Queue()
+    for item in [("loss", 1, 1.0), ("loss", 2, 2.0), ("loss", 2, 3.0)]:
+        metrics_queue.put(item)
+    metrics_queue.put(None)
+
+    _neptune_log_loop(experiment, metrics_queue)
+
+    assert experiment.logged == [("loss", 1, 1.0), ("loss", 2, 3.0)]
+    assert metrics_queue.unfinished_tasks == 0
+
+
+def test_metric_names(fake_neptune):
+    logger = NeptuneLogger(
+        metric_names=["loss"],
+        log_on_epoch_end=False,
+        api_token="token",
+        project_name="project",
+    )
+    for step in range(10):
+        logger.on_batch_end(_batch_state(step, {"loss": step, "acc": 1}))
+    logger.close()
+
+    names = {name for name, _, _ in fake_neptune.experiment.logged}
+    assert names == {"loss/train"}
+    assert len(fake_neptune.experiment.logged) == 10
+
+
+def test_batch_and_epoch_names(fake_neptune):
+    logger = NeptuneLogger(api_token="token", project_name="project")
+    for step in range(3):
+        logger.on_batch_end(_batch_state(step, {"loss": step}))
+    logger.on_loader_end(
+        SimpleNamespace(
+            loader_name="train", global_epoch=1, loader_metrics={"loss": 1}
+        )
+    )
+
+    assert logger._queue.unfinished_tasks == 0
+    assert fake_neptune.experiment.logged == [
+        ("loss/train_batch", 0, 0),
+        ("loss/train_batch", 1, 1),
+        ("loss/train_batch", 2, 2),
+        ("loss/train_epoch", 1, 1),
+    ]
+    logger.close()
+
+
+def test_init_is_lazy(fake_neptune):
+    logger = NeptuneLogger(api_token="token", project_name="project")
+    assert fake_neptune.calls == []
+
+    logger.on_batch_end(_batch_state(1, {"loss": 1.0}))
+    assert fake_neptune.calls == ["init", "create_experiment"]
+    logger.close()
+
+
+def test_missing_params():
+    with pytest.raises(ValueError):
+        NeptuneLogger(project_name="project")
+
+
+def test_init_failure_disables_logging(fake_neptune, monkeypatch):
+    def _create_experiment(**kwargs):
+        fake_neptune.calls.append("create_experiment")
+        raise ConnectionError()
+
+    monkeypatch.setattr(neptune, "create_experiment", _create_experiment)
+    logger = NeptuneLogger(api_token="token", project_name="project")
+
+    logger.on_batch_end(_batch_state(1, {"loss": 1.0}))
+    logger.on_batch_end(_batch_state(2, {"loss": 1.0}))
+    logger.on_stage_end(SimpleNamespace())
+    assert fake_neptune.calls == ["init", "create_experiment"]
+    assert logger._queue.qsize() == 0
@@ -1,18 +1,43 @@
-from torch import nn, optim
-
-from catalyst_rl.contrib.nn import optimizers as module
-from catalyst_rl.contrib.nn.optimizers import Lookahead
-
-
-def test_criterion_init():
-    model = nn.Linear(10, 10)
-    for name, cls in module.__dict__.items():
-        if isinstance(cls, type):
-            if name == "Optimizer":
-                continue
-            elif cls == Lookahead:
-                instance = optim.SGD(model.parameters(), lr=1e-3)
-                instance = cls(instance)
-            else:
-                instance = cls(model.parameters(), lr=1e-3)
-            assert instance is not None
+import pytest
+
+from torch import nn
+
+from catalyst_rl.contrib.nn import optimizers
+
+OPTIMIZERS_TO_TEST = [
+    optimizers.Adadelta,
+    optimizers.Adagrad,
+    optimizers.Adam,
+    optimizers.Adamax,
+    optimizers.ASGD,
+    optimizers.LBFGS,
+    optimizers.RMSprop,
+    optimizers.Rprop,
+    optimizers.SGD,
+    optimizers.SparseAdam,
+    pytest.param(
+        getattr(optimizers, "AdamW", None),
+        marks=pytest.mark.skipif(
+            not hasattr(optimizers, "AdamW"),
+            reason="AdamW requires torch>=1.2"
+        ),
+    ),
+    optimizers.Lamb,
+    optimizers.QHAdamW,
+    optimizers.RAdam,
+    optimizers.Ralamb,
+]
+
+PARAMS = list(nn.Linear(10, 10).parameters())
+
+
+@pytest.mark.parametrize("cls", OPTIMIZERS_TO_TEST)
+def test_optimizer_init(cls):
+    instance = cls(PARAMS, lr=1e-3)
+    assert instance is not None
+
+
+def test_lookahead_init():
+    instance = optimizers.SGD(PARAMS, lr=1e-3)
+    instance = optimizers.Lookahead(instance)
+    assert instance is not None
@@ -146,3 +146,19 @@ def test_add_module():
 
     with pytest.raises(RegistryException):
         r.get_instance("bar")
+
+
+def _late_add_foo(r: Registry):
+    r.add(foo)
+
+
+def test_late_add_idempotent():
+    r = Registry("")
+
+    r.late_add(_late_add_foo)
+    r.late_add(_late_add_foo)
+    assert len(r._late_add_callbacks) == 1
+
+    r.get("foo")
+    r.late_add(_late_add_foo)
+    assert len(r._late_add_callbacks) == 0
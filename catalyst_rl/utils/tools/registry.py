@@ -1,5 +1,6 @@
 from typing import (  # isort:skip
-    Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Type, Union
+    Any, Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple, Type,
+    Union
 )
 import collections
 import inspect
@@ -41,6 +42,7 @@ class Registry(collections.MutableMapping):
         self._name_key = default_name_key
         self._factories: Dict[str, Factory] = {}
         self._late_add_callbacks: List[LateAddCallbak] = []
+        self._late_add_keys: Set[Tuple[str, str]] = set()
 
     @staticmethod
     def _get_factory_name(f, provided_name=None) -> str:
@@ -118,10 +120,23 @@ class Registry(collections.MutableMapping):
         Allows to prevent cycle imports by delaying some imports till next
         registry query
 
+        Module-level callbacks are deduplicated by their module
+        and qualified name, so re-importing (or reloading) a module
+        that registers a callback does not rescan the same factories twice
+
         Args:
             cb: Callback receives registry and must call it's methods to
                 register factories
         """
+        module = getattr(cb, "__module__", None)
+        qualname = getattr(cb, "__qualname__", None)
+        # lambdas and nested functions can share the same qualname
+        if module is not None and qualname is not None \
+                and "<" not in qualname:
+            key = (module, qualname)
+            if key in self._late_add_keys:
+                return
+            self._late_add_keys.add(key)
         self._late_add_callbacks.append(cb)
 
     def add_from_module(